@@ -0,0 +1,7 @@
+"""Permet l'exécution via `python -m eds_synthetique`."""
+
+import sys
+
+from eds_synthetique.cli import main
+
+sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Point d'entrée en ligne de commande `eds-synthetique`.
+
+Ce module est importé à chaque appel : il ne dépend que d'`argparse`. Les modules
+nécessaires à une sous-commande sont importés dans sa fonction, de sorte que
+`--help` et les commandes triviales démarrent sans charger le reste du paquet.
+"""
+
+import argparse
+import sys
+from collections.abc import Iterator, Sequence
+
+
+def _erreur(message: str) -> int:
+    """
+    Signale une erreur sur la sortie d'erreur standard.
+
+    Le logging du projet (`configurer_logging`) écrit sur la sortie standard, qui
+    porte ici les données CSV : les erreurs sont donc écrites directement sur
+    la sortie d'erreur, au format des erreurs d'argparse.
+
+    Parameters
+    ----------
+    message : str
+        Description de l'erreur
+
+    Returns
+    -------
+    int
+        Code de retour d'erreur (2, comme argparse)
+    """
+    sys.stderr.write(f"eds-synthetique: erreur: {message}\n")
+    return 2
+
+
+def _separateur(valeur: str) -> str:
+    """
+    Valide le séparateur CSV passé en ligne de commande.
+
+    Parameters
+    ----------
+    valeur : str
+        Séparateur saisi, où la séquence `\\t` désigne une tabulation
+
+    Returns
+    -------
+    str
+        Séparateur d'un seul caractère
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        Si le séparateur ne fait pas exactement un caractère
+    """
+    separateur = "\t" if valeur == "\\t" else valeur
+    if len(separateur) != 1:
+        raise argparse.ArgumentTypeError(f"le séparateur doit être un seul caractère: {valeur!r}")
+    return separateur
+
+
+def _sous_ensemble(args: argparse.Namespace) -> int:
+    """
+    Extrait d'un fichier CSV les lignes des patients d'un sous-ensemble.
+
+    Le fichier est lu et écrit en flux : une seule passe, sans charger
+    l'ensemble des patients en mémoire.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments de la sous-commande `sous-ensemble`
+
+    Returns
+    -------
+    int
+        Code de retour du processus
+    """
+    import csv
+    import os
+    from contextlib import ExitStack
+
+    from eds_synthetique.domaine.partitionnement import SelectionPatients
+
+    try:
+        if args.fraction is not None:
+            selection = SelectionPatients.echantillon(args.fraction, args.graine)
+        else:
+            indice, nombre_partitions = args.partition
+            selection = SelectionPatients.partition(indice, nombre_partitions, args.graine)
+    except ValueError as e:
+        return _erreur(str(e))
+
+    try:
+        with ExitStack() as fichiers:
+            # newline="" est requis par le module csv (champs entre guillemets) et
+            # utf-8-sig retire l'éventuel BOM des exports de tableurs
+            entree = fichiers.enter_context(
+                open(
+                    sys.stdin.fileno() if args.fichier == "-" else args.fichier,
+                    newline="",
+                    encoding="utf-8-sig",
+                    closefd=args.fichier != "-",
+                )
+            )
+            lecteur = csv.reader(entree, delimiter=args.separateur)
+            entete = next(lecteur, None)
+            if entete is not None and args.colonne not in entete:
+                return _erreur(f"colonne absente: {args.colonne}")
+
+            # La sortie est créée même pour une entrée vide
+            sortie = (
+                sys.stdout
+                if args.sortie == "-"
+                else fichiers.enter_context(open(args.sortie, "w", newline="", encoding="utf-8"))
+            )
+            if entete is None:
+                return 0
+            position = entete.index(args.colonne)
+
+            def lignes_valides() -> Iterator[list[str]]:
+                for ligne in lecteur:
+                    if not ligne:
+                        continue
+                    if len(ligne) <= position:
+                        raise ValueError(
+                            f"ligne {lecteur.line_num} incomplète: colonne absente: {args.colonne}"
+                        )
+                    yield ligne
+
+            ecrivain = csv.writer(sortie, delimiter=args.separateur, lineterminator="\n")
+            ecrivain.writerow(entete)
+            ecrivain.writerows(selection.filtrer(lignes_valides(), lambda ligne: ligne[position]))
+            sortie.flush()
+    except BrokenPipeError:
+        # Sortie fermée par le lecteur (ex: `| head`) : arrêt silencieux, en
+        # redirigeant stdout pour que sa fermeture à la sortie ne relève pas l'erreur
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError, csv.Error) as e:
+        return _erreur(str(e))
+    return 0
+
+
+def _construire_parser() -> argparse.ArgumentParser:
+    """
+    Construit l'analyseur des arguments de la ligne de commande.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Analyseur avec une sous-commande par fonctionnalité
+    """
+    parser = argparse.ArgumentParser(
+        prog="eds-synthetique",
+        description="Générateur de SIH synthétique français.",
+    )
+    sous_commandes = parser.add_subparsers(title="sous-commandes", required=True)
+
+    sous_ensemble = sous_commandes.add_parser(
+        "sous-ensemble",
+        help="extraire les lignes d'un sous-ensemble de patients d'un fichier CSV",
+        description=(
+            "Filtre un fichier CSV par hachage de l'identifiant patient : appliquée "
+            "avec les mêmes options aux patients et aux passages, l'extraction conserve "
+            "chaque patient retenu avec tous ses passages."
+        ),
+    )
+    sous_ensemble.add_argument("fichier", help="fichier CSV à filtrer ('-' pour l'entrée standard)")
+    selection = sous_ensemble.add_mutually_exclusive_group(required=True)
+    selection.add_argument(
+        "--fraction", type=float, help="fraction des patients à conserver, dans [0.0001, 1]"
+    )
+    selection.add_argument(
+        "--partition",
+        type=int,
+        nargs=2,
+        metavar=("INDICE", "NOMBRE"),
+        help="partition INDICE parmi NOMBRE partitions disjointes",
+    )
+    sous_ensemble.add_argument(
+        "--colonne",
+        default="patient_id",
+        help="colonne contenant l'identifiant patient (défaut : patient_id)",
+    )
+    sous_ensemble.add_argument("--graine", type=int, default=0, help="graine du hachage")
+    sous_ensemble.add_argument(
+        "--separateur",
+        type=_separateur,
+        default=",",
+        help="séparateur CSV, '\\t' pour une tabulation (défaut : ,)",
+    )
+    sous_ensemble.add_argument(
+        "-o", "--sortie", default="-", help="fichier de sortie ('-' pour la sortie standard)"
+    )
+    sous_ensemble.set_defaults(executer=_sous_ensemble)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Exécute la ligne de commande.
+
+    Parameters
+    ----------
+    argv : Sequence[str] | None
+        Arguments à analyser (par défaut, ceux du processus)
+
+    Returns
+    -------
+    int
+        Code de retour du processus
+    """
+    args = _construire_parser().parse_args(argv)
+    return args.executer(args)
@@ -0,0 +1,240 @@
+"""Module définissant le partitionnement des patients par hachage de leur identifiant."""
+
+import hashlib
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+
+from eds_synthetique.domaine.passage import Passage
+from eds_synthetique.domaine.patient import IdentifiantPatient, Patient
+
+# Nombre de seaux utilisés pour les échantillons : résolution de 0,01 %
+NOMBRE_SEAUX_ECHANTILLON = 10_000
+
+# Borne (exclue) de la graine : le sel de BLAKE2b est limité à 16 octets
+GRAINE_MAX = 2**128
+
+
+def _sel_graine(graine: int) -> bytes:
+    """Valide la graine et la convertit en sel BLAKE2b."""
+    if not 0 <= graine < GRAINE_MAX:
+        raise ValueError(f"Graine invalide: {graine}")
+    return graine.to_bytes(16, "little")
+
+
+def _seau(valeur: str, nombre_seaux: int, sel: bytes) -> int:
+    """Calcule le seau d'une chaîne d'identifiant, sans validation."""
+    empreinte = hashlib.blake2b(valeur.encode(), digest_size=8, salt=sel).digest()
+    return int.from_bytes(empreinte, "little") % nombre_seaux
+
+
+def seau_patient(identifiant: IdentifiantPatient | str, nombre_seaux: int, graine: int = 0) -> int:
+    """
+    Calcule le seau d'un patient à partir d'un hachage stable de son identifiant.
+
+    Le hachage (BLAKE2b sur 64 bits) ne dépend que de la chaîne de l'identifiant
+    et de la graine : il est identique d'un processus à l'autre, ce qui permet
+    de filtrer patients et passages indépendamment tout en restant cohérent.
+
+    Parameters
+    ----------
+    identifiant : IdentifiantPatient | str
+        Identifiant du patient, ou sa chaîne telle qu'écrite dans un export
+    nombre_seaux : int
+        Nombre total de seaux (strictement positif)
+    graine : int
+        Graine du hachage (entier positif ou nul sur 128 bits au plus), pour
+        obtenir des sous-ensembles indépendants
+
+    Returns
+    -------
+    int
+        Numéro du seau, compris entre 0 et nombre_seaux - 1
+
+    Raises
+    ------
+    ValueError
+        Si le nombre de seaux n'est pas strictement positif ou si la graine est invalide
+    """
+    if nombre_seaux <= 0:
+        raise ValueError(f"Le nombre de seaux doit être strictement positif: {nombre_seaux}")
+    valeur = identifiant.valeur if isinstance(identifiant, IdentifiantPatient) else identifiant
+    return _seau(valeur, nombre_seaux, _sel_graine(graine))
+
+
+@dataclass(frozen=True)
+class SelectionPatients:
+    """
+    Value Object représentant un sous-ensemble de patients défini par hachage.
+
+    Un patient appartient à la sélection si son seau figure parmi les seaux
+    retenus. L'appartenance ne dépend que de l'identifiant du patient : un
+    passage est donc conservé si et seulement si son patient l'est, sans
+    jointure ni ensemble de patients en mémoire.
+
+    Parameters
+    ----------
+    nombre_seaux : int
+        Nombre total de seaux (strictement positif)
+    seaux : frozenset[int]
+        Seaux retenus, chacun compris entre 0 et nombre_seaux - 1
+    graine : int
+        Graine du hachage (entier positif ou nul sur 128 bits au plus)
+
+    Raises
+    ------
+    ValueError
+        Si le nombre de seaux, un seau ou la graine est invalide
+
+    Examples
+    --------
+    >>> echantillon = SelectionPatients.echantillon(0.01)
+    >>> partitions = [SelectionPatients.partition(k, 4) for k in range(4)]
+    """
+
+    nombre_seaux: int
+    seaux: frozenset[int]
+    graine: int = 0
+    _sel: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Valide le nombre de seaux, les seaux retenus et la graine."""
+        if self.nombre_seaux <= 0:
+            raise ValueError(
+                f"Le nombre de seaux doit être strictement positif: {self.nombre_seaux}"
+            )
+        hors_bornes = sorted(s for s in self.seaux if not 0 <= s < self.nombre_seaux)
+        if hors_bornes:
+            raise ValueError(f"Seaux hors de l'intervalle [0, {self.nombre_seaux}[: {hors_bornes}")
+        # Sel calculé une fois pour toutes : contient() est appelé pour chaque élément
+        object.__setattr__(self, "_sel", _sel_graine(self.graine))
+
+    @classmethod
+    def echantillon(cls, fraction: float, graine: int = 0) -> "SelectionPatients":
+        """
+        Crée une sélection contenant environ une fraction donnée des patients.
+
+        La fraction est arrondie au multiple de 1 / NOMBRE_SEAUX_ECHANTILLON
+        (0,01 %) le plus proche ; une fraction inférieure à ce minimum est refusée
+        plutôt qu'arrondie vers un échantillon plus grand que demandé.
+
+        Parameters
+        ----------
+        fraction : float
+            Fraction des patients à conserver, dans [1 / NOMBRE_SEAUX_ECHANTILLON, 1]
+        graine : int
+            Graine du hachage
+
+        Returns
+        -------
+        SelectionPatients
+            Sélection des premiers seaux parmi NOMBRE_SEAUX_ECHANTILLON
+
+        Raises
+        ------
+        ValueError
+            Si la fraction n'est pas dans [1 / NOMBRE_SEAUX_ECHANTILLON, 1]
+        """
+        if not 1 / NOMBRE_SEAUX_ECHANTILLON <= fraction <= 1:
+            raise ValueError(
+                f"La fraction doit être dans [1/{NOMBRE_SEAUX_ECHANTILLON}, 1]: {fraction}"
+            )
+        nombre_retenus = round(fraction * NOMBRE_SEAUX_ECHANTILLON)
+        return cls(NOMBRE_SEAUX_ECHANTILLON, frozenset(range(nombre_retenus)), graine)
+
+    @classmethod
+    def partition(cls, indice: int, nombre_partitions: int, graine: int = 0) -> "SelectionPatients":
+        """
+        Crée la sélection correspondant à l'une de N partitions disjointes.
+
+        Les N partitions obtenues pour une même graine sont disjointes et
+        couvrent l'ensemble des patients.
+
+        Parameters
+        ----------
+        indice : int
+            Indice de la partition, compris entre 0 et nombre_partitions - 1
+        nombre_partitions : int
+            Nombre total de partitions
+        graine : int
+            Graine du hachage
+
+        Returns
+        -------
+        SelectionPatients
+            Sélection réduite au seul seau `indice`
+        """
+        return cls(nombre_partitions, frozenset({indice}), graine)
+
+    def contient(self, identifiant: IdentifiantPatient | str) -> bool:
+        """
+        Indique si un patient appartient à la sélection.
+
+        Parameters
+        ----------
+        identifiant : IdentifiantPatient | str
+            Identifiant du patient, ou sa chaîne telle qu'écrite dans un export
+
+        Returns
+        -------
+        bool
+            True si le seau du patient fait partie des seaux retenus
+        """
+        valeur = identifiant.valeur if isinstance(identifiant, IdentifiantPatient) else identifiant
+        return _seau(valeur, self.nombre_seaux, self._sel) in self.seaux
+
+    def filtrer_patients(self, patients: Iterable[Patient]) -> Iterator[Patient]:
+        """
+        Filtre un flux de patients en une seule passe.
+
+        Parameters
+        ----------
+        patients : Iterable[Patient]
+            Patients à filtrer (liste en mémoire, lot ou générateur)
+
+        Returns
+        -------
+        Iterator[Patient]
+            Patients appartenant à la sélection, dans l'ordre d'origine
+        """
+        return self.filtrer(patients, lambda patient: patient.identifiant)
+
+    def filtrer_passages(self, passages: Iterable[Passage]) -> Iterator[Passage]:
+        """
+        Filtre un flux de passages en une seule passe.
+
+        Parameters
+        ----------
+        passages : Iterable[Passage]
+            Passages à filtrer (liste en mémoire, lot ou générateur)
+
+        Returns
+        -------
+        Iterator[Passage]
+            Passages dont le patient appartient à la sélection
+        """
+        return self.filtrer(passages, lambda passage: passage.patient_id)
+
+    def filtrer[T](
+        self,
+        elements: Iterable[T],
+        identifiant_patient: Callable[[T], IdentifiantPatient | str],
+    ) -> Iterator[T]:
+        """
+        Filtre un flux quelconque d'éléments rattachés à un patient.
+
+        Permet de filtrer directement des enregistrements exportés (lignes CSV,
+        dictionnaires JSON, ...) sans reconstruire les entités du domaine.
+
+        Parameters
+        ----------
+        elements : Iterable[T]
+            Éléments à filtrer
+        identifiant_patient : Callable[[T], IdentifiantPatient | str]
+            Fonction extrayant l'identifiant du patient d'un élément
+
+        Returns
+        -------
+        Iterator[T]
+            Éléments dont le patient appartient à la sélection
+        """
+        return (element for element in elements if self.contient(identifiant_patient(element)))
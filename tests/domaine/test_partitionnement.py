@@ -0,0 +1,162 @@
+"""Tests pour le partitionnement des patients par hachage."""
+
+import uuid
+from dataclasses import FrozenInstanceError
+from datetime import date, datetime
+
+import pytest
+
+from eds_synthetique.domaine.partitionnement import SelectionPatients, seau_patient
+from eds_synthetique.domaine.passage import IdentifiantPassage, Passage, Periode, TypePassage
+from eds_synthetique.domaine.patient import IdentifiantPatient, Patient, Sexe
+
+
+def _creer_patient() -> Patient:
+    return Patient(
+        identifiant=IdentifiantPatient.generer(),
+        nom="Dupont",
+        prenom="Jean",
+        date_naissance=date(1980, 5, 15),
+        sexe=Sexe.MASCULIN,
+    )
+
+
+def _creer_passage(patient: Patient) -> Passage:
+    return Passage(
+        identifiant=IdentifiantPassage.generer(),
+        patient_id=patient.identifiant,
+        periode=Periode(debut=datetime(2025, 1, 15, 10, 0, 0), fin=None),
+        type_passage=TypePassage.CONSULTATION,
+    )
+
+
+# Tests pour seau_patient
+
+
+def test_seau_patient_stable() -> None:
+    """Test que le seau d'un identifiant est déterministe et connu."""
+    identifiant = IdentifiantPatient("550e8400-e29b-41d4-a716-446655440000")
+
+    # Valeurs figées : le filtrage des patients et des passages en des exécutions
+    # séparées repose sur un hachage identique d'un processus et d'une version à l'autre
+    assert seau_patient(identifiant, 1000) == 783
+    assert seau_patient(identifiant.valeur, 1000) == 783
+    assert seau_patient(identifiant, 1000, graine=42) == 664
+
+
+def test_seau_patient_dans_les_bornes() -> None:
+    """Test que le seau est compris entre 0 et nombre_seaux - 1."""
+    for _ in range(100):
+        assert 0 <= seau_patient(IdentifiantPatient.generer(), 7) < 7
+
+
+def test_seau_patient_depend_de_la_graine() -> None:
+    """Test que des graines différentes donnent des répartitions différentes."""
+    identifiants = [IdentifiantPatient.generer() for _ in range(50)]
+
+    seaux_graine_0 = [seau_patient(i, 1000, graine=0) for i in identifiants]
+    seaux_graine_1 = [seau_patient(i, 1000, graine=1) for i in identifiants]
+
+    assert seaux_graine_0 != seaux_graine_1
+
+
+def test_seau_patient_nombre_seaux_invalide_leve_erreur() -> None:
+    """Test qu'un nombre de seaux nul lève une ValueError."""
+    with pytest.raises(ValueError, match="strictement positif"):
+        seau_patient(IdentifiantPatient.generer(), 0)
+
+
+@pytest.mark.parametrize("graine", [-1, 2**128])
+def test_seau_patient_graine_invalide_leve_erreur(graine: int) -> None:
+    """Test qu'une graine hors de [0, 2**128[ lève une ValueError."""
+    with pytest.raises(ValueError, match="Graine invalide"):
+        seau_patient(IdentifiantPatient.generer(), 10, graine=graine)
+
+
+# Tests pour SelectionPatients (Value Object)
+
+
+def test_selection_immutable() -> None:
+    """Test de l'immutabilité du Value Object SelectionPatients."""
+    selection = SelectionPatients.partition(0, 2)
+
+    with pytest.raises(FrozenInstanceError):
+        selection.graine = 1  # type: ignore[misc]
+
+
+def test_selection_seau_hors_bornes_leve_erreur() -> None:
+    """Test qu'un seau hors de l'intervalle lève une ValueError."""
+    with pytest.raises(ValueError, match="Seaux hors de l'intervalle"):
+        SelectionPatients.partition(4, 4)
+
+
+def test_selection_graine_negative_leve_erreur() -> None:
+    """Test qu'une graine négative lève une ValueError."""
+    with pytest.raises(ValueError, match="Graine invalide"):
+        SelectionPatients(nombre_seaux=2, seaux=frozenset({0}), graine=-1)
+
+
+@pytest.mark.parametrize("fraction", [0.0, -0.1, 1.5, 0.00001])
+def test_echantillon_fraction_invalide_leve_erreur(fraction: float) -> None:
+    """Test qu'une fraction hors de [1/10000, 1] lève une ValueError."""
+    with pytest.raises(ValueError, match="La fraction doit être"):
+        SelectionPatients.echantillon(fraction)
+
+
+def test_echantillon_fraction_minimale() -> None:
+    """Test que la plus petite fraction acceptée retient un seul seau."""
+    selection = SelectionPatients.echantillon(0.0001)
+
+    assert selection.seaux == frozenset({0})
+
+
+def test_echantillon_complet_contient_tous_les_patients() -> None:
+    """Test qu'un échantillon de fraction 1 contient tous les patients."""
+    selection = SelectionPatients.echantillon(1.0)
+
+    assert all(selection.contient(IdentifiantPatient.generer()) for _ in range(100))
+
+
+def test_echantillon_respecte_approximativement_la_fraction() -> None:
+    """Test que la proportion de patients retenus est proche de la fraction."""
+    selection = SelectionPatients.echantillon(0.1)
+    identifiants = [str(uuid.uuid4()) for _ in range(20_000)]
+
+    proportion = sum(selection.contient(i) for i in identifiants) / len(identifiants)
+
+    assert 0.09 < proportion < 0.11
+
+
+def test_partitions_disjointes_et_couvrantes() -> None:
+    """Test que les N partitions sont disjointes et couvrent tous les patients."""
+    partitions = [SelectionPatients.partition(k, 4, graine=3) for k in range(4)]
+
+    for _ in range(200):
+        identifiant = IdentifiantPatient.generer()
+        assert sum(p.contient(identifiant) for p in partitions) == 1
+
+
+def test_filtrage_coherent_patients_et_passages() -> None:
+    """Test que chaque patient retenu vient avec tous ses passages."""
+    patients = [_creer_patient() for _ in range(200)]
+    passages = [_creer_passage(p) for p in patients for _ in range(3)]
+    selection = SelectionPatients.echantillon(0.5)
+
+    patients_retenus = {p.identifiant for p in selection.filtrer_patients(patients)}
+    passages_retenus = list(selection.filtrer_passages(iter(passages)))
+
+    assert {p.patient_id for p in passages_retenus} == patients_retenus
+    assert len(passages_retenus) == 3 * len(patients_retenus)
+
+
+def test_filtrer_enregistrements_exportes() -> None:
+    """Test du filtrage d'enregistrements exportés via une fonction d'extraction."""
+    patients = [_creer_patient() for _ in range(100)]
+    enregistrements = [{"patient_id": str(p.identifiant)} for p in patients]
+    selection = SelectionPatients.partition(1, 3)
+
+    retenus = list(selection.filtrer(enregistrements, lambda e: e["patient_id"]))
+
+    assert [e["patient_id"] for e in retenus] == [
+        str(p.identifiant) for p in selection.filtrer_patients(patients)
+    ]
@@ -0,0 +1,256 @@
+"""Tests pour le point d'entrée en ligne de commande."""
+
+import os
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+from eds_synthetique.cli import main
+from eds_synthetique.domaine.partitionnement import SelectionPatients
+
+RACINE_SOURCES = Path(__file__).resolve().parents[1] / "src"
+
+# Budget du temps d'import du module CLI, argparse compris (en microsecondes)
+BUDGET_IMPORT_US = 50_000
+
+# Modules qui ne doivent être importés que par les sous-commandes qui en ont besoin
+MODULES_PARESSEUX = ["csv", "hashlib", "eds_synthetique.domaine"]
+
+
+def _executer_python(*arguments: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PYTHONPATH": str(RACINE_SOURCES)}
+    return subprocess.run(
+        [sys.executable, *arguments], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def _ecrire_csv(chemin: Path, identifiants: list[str]) -> None:
+    lignes = ["passage_id,patient_id"] + [f"{uuid.uuid4()},{i}" for i in identifiants]
+    chemin.write_text("\n".join(lignes) + "\n", encoding="utf-8")
+
+
+# Tests du temps de démarrage
+
+
+def test_import_cli_ne_charge_pas_les_modules_paresseux() -> None:
+    """Test que l'import du module CLI ne charge pas les dépendances des sous-commandes."""
+    resultat = _executer_python(
+        "-c",
+        "import sys, eds_synthetique.cli; "
+        f"print(','.join(m for m in {MODULES_PARESSEUX!r} if m in sys.modules))",
+    )
+
+    assert resultat.stdout.strip() == ""
+
+
+def test_import_cli_respecte_le_budget() -> None:
+    """Test que le temps d'import cumulé du module CLI reste sous le budget."""
+    resultat = _executer_python("-X", "importtime", "-c", "import eds_synthetique.cli")
+
+    ligne_cli = next(
+        ligne for ligne in resultat.stderr.splitlines() if ligne.endswith(" eds_synthetique.cli")
+    )
+    cumul_us = int(ligne_cli.split("|")[1])
+
+    assert cumul_us < BUDGET_IMPORT_US
+
+
+def test_aide_via_module() -> None:
+    """Test que `python -m eds_synthetique --help` affiche l'aide."""
+    resultat = _executer_python("-m", "eds_synthetique", "--help")
+
+    assert "sous-ensemble" in resultat.stdout
+
+
+# Tests de la sous-commande sous-ensemble
+
+
+def test_sous_ensemble_fraction(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test que l'extraction par fraction conserve les patients de la sélection."""
+    identifiants = [str(uuid.uuid4()) for _ in range(100)]
+    fichier = tmp_path / "passages.csv"
+    _ecrire_csv(fichier, identifiants)
+    selection = SelectionPatients.echantillon(0.5, graine=7)
+
+    code = main(["sous-ensemble", str(fichier), "--fraction", "0.5", "--graine", "7"])
+
+    lignes = capsys.readouterr().out.splitlines()
+    assert code == 0
+    assert lignes[0] == "passage_id,patient_id"
+    assert [ligne.split(",")[1] for ligne in lignes[1:]] == [
+        i for i in identifiants if selection.contient(i)
+    ]
+
+
+def test_sous_ensemble_partitions_disjointes(tmp_path: Path) -> None:
+    """Test que les partitions écrites sont disjointes et couvrent le fichier."""
+    identifiants = [str(uuid.uuid4()) for _ in range(60)]
+    fichier = tmp_path / "passages.csv"
+    _ecrire_csv(fichier, identifiants)
+
+    extraits: list[str] = []
+    for indice in range(3):
+        sortie = tmp_path / f"partition_{indice}.csv"
+        code = main(
+            ["sous-ensemble", str(fichier), "--partition", str(indice), "3", "-o", str(sortie)]
+        )
+        assert code == 0
+        extraits += sortie.read_text(encoding="utf-8").splitlines()[1:]
+
+    assert sorted(ligne.split(",")[1] for ligne in extraits) == sorted(identifiants)
+
+
+def test_sous_ensemble_colonne_absente(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test qu'une colonne absente renvoie un code d'erreur."""
+    fichier = tmp_path / "passages.csv"
+    _ecrire_csv(fichier, [str(uuid.uuid4())])
+
+    code = main(["sous-ensemble", str(fichier), "--fraction", "0.5", "--colonne", "inconnue"])
+
+    assert code == 2
+    assert "colonne absente" in capsys.readouterr().err
+
+
+def test_sous_ensemble_fraction_invalide(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test qu'une fraction invalide renvoie un code d'erreur."""
+    fichier = tmp_path / "passages.csv"
+    _ecrire_csv(fichier, [str(uuid.uuid4())])
+
+    code = main(["sous-ensemble", str(fichier), "--fraction", "2"])
+
+    assert code == 2
+    assert "La fraction doit être" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("separateur", ["ab", ""])
+def test_sous_ensemble_separateur_invalide(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], separateur: str
+) -> None:
+    """Test qu'un séparateur de plusieurs caractères est refusé par argparse."""
+    fichier = tmp_path / "passages.csv"
+    _ecrire_csv(fichier, [str(uuid.uuid4())])
+
+    with pytest.raises(SystemExit) as erreur:
+        main(["sous-ensemble", str(fichier), "--fraction", "1", "--separateur", separateur])
+
+    assert erreur.value.code == 2
+    assert "le séparateur doit être un seul caractère" in capsys.readouterr().err
+
+
+def test_sous_ensemble_separateur_tabulation(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test que `\\t` désigne une tabulation."""
+    identifiant = str(uuid.uuid4())
+    fichier = tmp_path / "passages.tsv"
+    fichier.write_text(f"passage_id\tpatient_id\n1\t{identifiant}\n", encoding="utf-8")
+
+    code = main(["sous-ensemble", str(fichier), "--fraction", "1", "--separateur", "\\t"])
+
+    assert code == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "passage_id\tpatient_id",
+        f"1\t{identifiant}",
+    ]
+
+
+def test_sous_ensemble_ignore_les_lignes_vides(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test que les lignes vides, dont la ligne finale, sont ignorées."""
+    identifiant = str(uuid.uuid4())
+    fichier = tmp_path / "passages.csv"
+    fichier.write_text(f"passage_id,patient_id\n\n1,{identifiant}\n\n", encoding="utf-8")
+
+    code = main(["sous-ensemble", str(fichier), "--fraction", "1"])
+
+    assert code == 0
+    assert capsys.readouterr().out.splitlines() == ["passage_id,patient_id", f"1,{identifiant}"]
+
+
+def test_sous_ensemble_ligne_incomplete(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test qu'une ligne sans la colonne identifiant renvoie un code d'erreur."""
+    fichier = tmp_path / "passages.csv"
+    fichier.write_text(f"passage_id,patient_id\n1,{uuid.uuid4()}\n2\n", encoding="utf-8")
+
+    code = main(["sous-ensemble", str(fichier), "--fraction", "1"])
+
+    assert code == 2
+    assert "ligne 3 incomplète" in capsys.readouterr().err
+
+
+def test_sous_ensemble_fichier_absent(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test qu'un fichier d'entrée absent renvoie un code d'erreur."""
+    code = main(["sous-ensemble", str(tmp_path / "absent.csv"), "--fraction", "0.5"])
+
+    assert code == 2
+    assert "eds-synthetique: erreur:" in capsys.readouterr().err
+
+
+def test_sous_ensemble_entree_vide_cree_la_sortie(tmp_path: Path) -> None:
+    """Test qu'une entrée vide produit tout de même le fichier de sortie."""
+    fichier = tmp_path / "passages.csv"
+    fichier.write_text("", encoding="utf-8")
+    sortie = tmp_path / "extrait.csv"
+
+    code = main(["sous-ensemble", str(fichier), "--fraction", "0.5", "-o", str(sortie)])
+
+    assert code == 0
+    assert sortie.read_text(encoding="utf-8") == ""
+
+
+def test_sous_ensemble_entree_avec_bom(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test qu'un BOM UTF-8 en tête de fichier ne masque pas la première colonne."""
+    identifiant = str(uuid.uuid4())
+    fichier = tmp_path / "patients.csv"
+    fichier.write_text(f"patient_id,nom\n{identifiant},Dupont\n", encoding="utf-8-sig")
+
+    code = main(["sous-ensemble", str(fichier), "--fraction", "1"])
+
+    assert code == 0
+    assert capsys.readouterr().out.splitlines() == ["patient_id,nom", f"{identifiant},Dupont"]
+
+
+def test_sous_ensemble_entree_standard_champ_multiligne() -> None:
+    """Test que l'entrée standard conserve les champs entre guillemets multilignes."""
+    identifiant = str(uuid.uuid4())
+    contenu = f'patient_id,commentaire\r\n{identifiant},"ligne 1\r\nligne 2"\r\n'
+    env = {**os.environ, "PYTHONPATH": str(RACINE_SOURCES)}
+
+    resultat = subprocess.run(
+        [sys.executable, "-m", "eds_synthetique", "sous-ensemble", "-", "--fraction", "1"],
+        input=contenu.encode(),
+        capture_output=True,
+        env=env,
+        check=True,
+    )
+
+    assert resultat.stdout.decode() == (
+        f'patient_id,commentaire\n{identifiant},"ligne 1\r\nligne 2"\n'
+    )
+
+
+def test_sous_ensemble_sortie_fermee(tmp_path: Path) -> None:
+    """Test qu'une sortie fermée par le lecteur (`| head`) arrête la commande sans trace."""
+    fichier = tmp_path / "passages.csv"
+    _ecrire_csv(fichier, [str(uuid.uuid4()) for _ in range(5_000)])
+    env = {**os.environ, "PYTHONPATH": str(RACINE_SOURCES)}
+
+    with subprocess.Popen(
+        [sys.executable, "-m", "eds_synthetique", "sous-ensemble", str(fichier), "--fraction", "1"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    ) as processus:
+        assert processus.stdout is not None and processus.stderr is not None
+        processus.stdout.readline()
+        processus.stdout.close()
+        erreurs = processus.stderr.read()
+
+    assert processus.returncode == 1
+    assert erreurs == b""